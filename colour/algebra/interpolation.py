@@ -916,7 +916,8 @@ class SpragueInterpolator(object):
         variable.
     y : array_like
         Dependent and already known :math:`y` variable values to
-        interpolate.
+        interpolate, if two-dimensional, each column is interpolated
+        independently.
     dtype : type
         Data type used for internal conversions.
 
@@ -933,6 +934,7 @@ class SpragueInterpolator(object):
     -----
     -   The minimum number :math:`k` of data points required along the
         interpolation axis is :math:`k=6`.
+    -   The interpolation axis is the first axis of the :math:`y` variable.
 
     References
     ----------
@@ -953,6 +955,12 @@ class SpragueInterpolator(object):
 
     >>> f([0.25, 0.75])  # doctest: +ELLIPSIS
     array([ 6.7295161...,  7.8140625...])
+
+    Interpolating a two-dimensional :math:`y` variable:
+
+    >>> f = SpragueInterpolator(x, np.transpose([y, y * 2]))
+    >>> f(0.5)  # doctest: +ELLIPSIS
+    array([  7.2185025...,  14.4370051...])
     """
 
     SPRAGUE_C_COEFFICIENTS = np.array([
@@ -1055,25 +1063,17 @@ class SpragueInterpolator(object):
         if value is not None:
             value = np.atleast_1d(value).astype(self._dtype)
 
-            assert value.ndim == 1, (
-                '"y" dependent variable must have exactly one dimension!')
+            assert value.ndim in (1, 2), (
+                '"y" dependent variable must have one or two dimensions!')
 
             assert len(value) >= 6, (
                 '"y" dependent variable values count must be normalised to'
                 'domain [6:]!')
 
-            yp1 = np.ravel((np.dot(self.SPRAGUE_C_COEFFICIENTS[0],
-                                   np.array(value[0:6]).reshape(
-                                       (6, 1)))) / 209)[0]
-            yp2 = np.ravel((np.dot(self.SPRAGUE_C_COEFFICIENTS[1],
-                                   np.array(value[0:6]).reshape(
-                                       (6, 1)))) / 209)[0]
-            yp3 = np.ravel((np.dot(self.SPRAGUE_C_COEFFICIENTS[2],
-                                   np.array(value[-6:]).reshape(
-                                       (6, 1)))) / 209)[0]
-            yp4 = np.ravel((np.dot(self.SPRAGUE_C_COEFFICIENTS[3],
-                                   np.array(value[-6:]).reshape(
-                                       (6, 1)))) / 209)[0]
+            yp1 = np.dot(self.SPRAGUE_C_COEFFICIENTS[0], value[0:6]) / 209
+            yp2 = np.dot(self.SPRAGUE_C_COEFFICIENTS[1], value[0:6]) / 209
+            yp3 = np.dot(self.SPRAGUE_C_COEFFICIENTS[2], value[-6:]) / 209
+            yp4 = np.dot(self.SPRAGUE_C_COEFFICIENTS[3], value[-6:]) / 209
 
             self._yp = np.concatenate(((yp1, yp2), value, (yp3, yp4)))
 
@@ -1120,6 +1120,8 @@ class SpragueInterpolator(object):
         X = (x - self._xp[i]) / (self._xp[i + 1] - self._xp[i])
 
         r = self._yp
+        if r.ndim == 2:
+            X = X[..., np.newaxis]
 
         a0p = r[i]
         a1p = ((2 * r[i - 2] - 16 * r[i - 1] + 16 * r[i + 1] -
@@ -724,6 +724,15 @@ class TestSpragueInterpolator(unittest.TestCase):
                           len(POINTS_DATA_A) - 1 + interval, interval)),
             SPRAGUE_INTERPOLATED_POINTS_DATA_A_10_SAMPLES)
 
+        sprague_interpolator = SpragueInterpolator(
+            x, np.transpose([POINTS_DATA_A, POINTS_DATA_A]))
+
+        np.testing.assert_almost_equal(
+            sprague_interpolator(
+                np.arange(0,
+                          len(POINTS_DATA_A) - 1 + interval, interval)),
+            np.transpose([SPRAGUE_INTERPOLATED_POINTS_DATA_A_10_SAMPLES] * 2))
+
     def test_raise_exception___call__(self):
         """
         Tests :func:`colour.algebra.interpolation.SpragueInterpolator.__call__`
@@ -737,14 +737,15 @@ dict_like, optional
         SpectralShape(500.0, 600.0, 10.0)
         """
 
-        wavelengths_interval = interval(self.wavelengths)
+        wavelengths = self.wavelengths
+        wavelengths_interval = interval(wavelengths)
         if wavelengths_interval.size != 1:
             runtime_warning(('"{0}" spectral distribution is not uniform, '
                              'using minimum interval!'.format(self.name)))
 
         return SpectralShape(
-            min(self.wavelengths), max(self.wavelengths),
-            as_float(min(wavelengths_interval)))
+            np.min(wavelengths), np.max(wavelengths),
+            as_float(np.min(wavelengths_interval)))
 
     def extrapolate(self, shape, extrapolator=None, extrapolator_args=None):
         """
@@ -11,10 +11,17 @@ References
 
 from __future__ import division, unicode_literals
 
+import gc
 import numpy as np
 import unittest
 
-from colour.algebra import LinearInterpolator
+try:
+    from unittest import mock
+except ImportError:  # pragma: no cover
+    import mock
+
+from colour.algebra import (CubicSplineInterpolator, LinearInterpolator,
+                            PchipInterpolator)
 from colour.colorimetry import (CMFS, sd_CIE_standard_illuminant_A,
                                 ILLUMINANTS_SDS, MultiSpectralDistributions,
                                 SpectralDistribution, SpectralShape)
@@ -23,6 +30,11 @@ from colour.colorimetry import (
     adjust_tristimulus_weighting_factors_ASTME308, sd_to_XYZ_integration,
     sd_to_XYZ_tristimulus_weighting_factors_ASTME308, sd_to_XYZ_ASTME308,
     multi_sds_to_XYZ_integration, multi_sds_to_XYZ_ASTME308, wavelength_to_XYZ)
+from colour.colorimetry import tristimulus
+from colour.colorimetry.tristimulus import (
+    _tristimulus_weighting_factors_kernel_ASTME2022_NumPy,
+    _tristimulus_weighting_factors_kernel_ASTME2022_Numba,
+    _tristimulus_weighting_factors_kernel_ASTME2022_resolve)
 from colour.utilities import domain_range_scale
 
 __author__ = 'Colour Developers'
@@ -448,6 +460,10 @@ lagrange_coefficients_ASTME2022` definition unit tests methods.
             LAGRANGE_COEFFICIENTS_B,
             decimal=7)
 
+        self.assertIs(
+            lagrange_coefficients_ASTME2022(10, 'Inner'),
+            lagrange_coefficients_ASTME2022(10, 'inner'))
+
 
 class TestTristimulusWeightingFactorsASTME2022(unittest.TestCase):
     """
@@ -497,6 +513,144 @@ tristimulus_weighting_factors_ASTME2022` definition.
         np.testing.assert_almost_equal(
             twf, D65_CIE_1931_2_20_TWF_K1, decimal=7)
 
+        D65_r = D65.copy()
+        D65_r.values = D65_r.values[::-1]
+        twf = tristimulus_weighting_factors_ASTME2022(
+            cmfs, D65_r, SpectralShape(360, 830, 20))
+        self.assertEqual(D65_r.name, D65.name)
+        self.assertFalse(
+            np.allclose(np.round(twf, 3), D65_CIE_1931_2_20_TWF))
+
+    def test_tristimulus_weighting_factors_kernels_ASTME2022(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+tristimulus_weighting_factors_ASTME2022` definition kernels.
+
+        Notes
+        -----
+        -   Only one of the kernels is used by the definition depending on
+            whether *Numba* is installed, both are thus tested explicitly, the
+            *Numba* kernel being executed uncompiled.
+        """
+
+        cmfs_1 = CMFS['CIE 1964 10 Degree Standard Observer']
+        A = sd_CIE_standard_illuminant_A(cmfs_1.shape)
+        cmfs_2 = CMFS['CIE 1931 2 Degree Standard Observer']
+        D65 = ILLUMINANTS_SDS['D65'].copy().align(
+            cmfs_2.shape, interpolator=LinearInterpolator)
+
+        # The trimmed colour matching functions and illuminants move the last
+        # measurement interval and vary its completeness.
+        cmfs_sds = [(cmfs_1, A), (cmfs_2, D65)]
+        for start, end in ((360, 780), (362, 789), (375, 786)):
+            shape = SpectralShape(start, end, 1)
+            cmfs_sds.append((cmfs_2.copy().trim(shape),
+                             D65.copy().trim(shape)))
+
+        kernels = (_tristimulus_weighting_factors_kernel_ASTME2022_NumPy,
+                   _tristimulus_weighting_factors_kernel_ASTME2022_Numba)
+        tables, errors = [], []
+        for kernel in kernels:
+            with mock.patch(
+                    'colour.colorimetry.tristimulus.'
+                    '_tristimulus_weighting_factors_kernel_ASTME2022',
+                    kernel), mock.patch(
+                        'colour.colorimetry.tristimulus.'
+                        '_TRISTIMULUS_WEIGHTING_FACTORS_CACHE', None):
+                np.testing.assert_almost_equal(
+                    np.round(
+                        tristimulus_weighting_factors_ASTME2022(
+                            cmfs_1, A, SpectralShape(360, 830, 10)), 3),
+                    A_CIE_1964_10_10_TWF,
+                    decimal=3)
+                np.testing.assert_almost_equal(
+                    np.round(
+                        tristimulus_weighting_factors_ASTME2022(
+                            cmfs_1, A, SpectralShape(360, 830, 20)), 3),
+                    A_CIE_1964_10_20_TWF,
+                    decimal=3)
+                np.testing.assert_almost_equal(
+                    tristimulus_weighting_factors_ASTME2022(
+                        cmfs_2, D65, SpectralShape(360, 830, 20), k=1),
+                    D65_CIE_1931_2_20_TWF_K1,
+                    decimal=7)
+
+                tables.append([
+                    tristimulus_weighting_factors_ASTME2022(
+                        cmfs, sd, SpectralShape(360, 830, interval))
+                    for cmfs, sd in cmfs_sds
+                    for interval in (3, 5, 7, 10, 20, 30)
+                ])
+
+                # The smallest supported tables have 3 measurement
+                # wavelengths, a single one fewer raises an exception.
+                for end, interval in ((420, 10), (425, 10), (440, 20)):
+                    shape = SpectralShape(400, end, 1)
+                    tables[-1].append(
+                        tristimulus_weighting_factors_ASTME2022(
+                            cmfs_2.copy().trim(shape),
+                            D65.copy().trim(shape),
+                            SpectralShape(400, end, interval),
+                            k=1))
+
+                shape = SpectralShape(400, 419, 1)
+                with self.assertRaises(ValueError) as context:
+                    tristimulus_weighting_factors_ASTME2022(
+                        cmfs_2.copy().trim(shape), D65.copy().trim(shape),
+                        SpectralShape(400, 419, 10))
+                errors.append(str(context.exception))
+
+        for table_NumPy, table_Numba in zip(*tables):
+            np.testing.assert_almost_equal(
+                table_NumPy, table_Numba, decimal=12)
+
+        self.assertEqual(errors[0], errors[1])
+
+    def test_tristimulus_weighting_factors_kernels_accumulation_ASTME2022(
+            self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+tristimulus_weighting_factors_ASTME2022` definition kernels accumulation on
+        arbitrary illuminant weighted colour matching functions.
+        """
+
+        # The resolved kernel is the compiled *Numba* kernel if *Numba* is
+        # installed, the smallest supported tables having 3 measurement
+        # wavelengths are also accumulated with it.
+        kernels = (_tristimulus_weighting_factors_kernel_ASTME2022_NumPy,
+                   _tristimulus_weighting_factors_kernel_ASTME2022_Numba,
+                   _tristimulus_weighting_factors_kernel_ASTME2022_resolve())
+
+        SY_r = np.random.RandomState(4).random_sample([471, 3])
+        cases = [(471, interval) for interval in (2, 3, 5, 10, 20)]
+        cases += [(11, 5), (21, 10), (25, 10), (41, 20)]
+        for count, interval in cases:
+            SY = SY_r[:count, :].copy()
+            c_c = lagrange_coefficients_ASTME2022(interval, 'boundary')
+            c_b = lagrange_coefficients_ASTME2022(interval, 'inner')
+            r_c = c_b.shape[0]
+            w_lif = len(SY) - (len(SY) - 1) % interval - 1 - r_c
+            W = SY[::interval, :].copy()
+            i_c = W.shape[0]
+
+            W_NumPy = W.copy()
+            _tristimulus_weighting_factors_kernel_ASTME2022_NumPy(
+                W_NumPy, SY, c_c, c_b, r_c, i_c, i_c - 1, w_lif)
+            self.assertFalse(np.allclose(W_NumPy, W))
+
+            for kernel in kernels:
+                W_k = W.copy()
+                kernel(W_k, SY, c_c, c_b, r_c, i_c, i_c - 1, w_lif)
+                np.testing.assert_almost_equal(W_k, W_NumPy, decimal=12)
+
+                # The channels are accumulated independently: permuting
+                # them permutes the accumulated table columns.
+                W_p = W[:, ::-1].copy()
+                kernel(W_p, SY[:, ::-1].copy(), c_c, c_b, r_c, i_c, i_c - 1,
+                       w_lif)
+                np.testing.assert_almost_equal(
+                    W_p, W_NumPy[:, ::-1], decimal=12)
+
     def test_raise_exception_tristimulus_weighting_factors_ASTME2022(self):
         """
         Tests :func:`colour.colorimetry.tristimulus.\
@@ -515,6 +669,14 @@ tristimulus_weighting_factors_ASTME2022` definition raised exception.
         self.assertRaises(ValueError, tristimulus_weighting_factors_ASTME2022,
                           cmfs_2, A_1, shape)
 
+        shape = SpectralShape(400, 410, 1)
+        cmfs_3 = cmfs_1.copy().trim(shape)
+        A_3 = sd_CIE_standard_illuminant_A(shape)
+        for interval in (10, 20):
+            self.assertRaises(
+                ValueError, tristimulus_weighting_factors_ASTME2022, cmfs_3,
+                A_3, SpectralShape(400, 410, interval))
+
 
 class TestAdjustTristimulusWeightingFactorsASTME308(unittest.TestCase):
     """
@@ -1002,6 +1164,37 @@ multi_sds_to_XYZ_integration`
             XYZ_D65_ARRAY_K1_INTEGRATION,
             decimal=7)
 
+        shape = SpectralShape(400, 700, 60)
+        D65 = ILLUMINANTS_SDS['D65'].copy().align(shape)
+        D65[400] = D65[700] = 0
+        np.testing.assert_almost_equal(
+            multi_sds_to_XYZ_integration(
+                MSDS_ARRAY, cmfs, D65, 1, shape=shape),
+            np.einsum('...i,ij->...j', MSDS_ARRAY,
+                      D65.values[..., np.newaxis] *
+                      cmfs.copy().align(shape).values) * 60,
+            decimal=7)
+
+        msds = np.copy(MSDS_ARRAY)
+        msds[0, 0, 0] = np.nan
+        msds[1, 2, -1] = np.inf
+        np.testing.assert_almost_equal(
+            multi_sds_to_XYZ_integration(msds, cmfs, D65, 1, shape=shape),
+            np.einsum('...i,ij->...j', msds,
+                      D65.values[..., np.newaxis] *
+                      cmfs.copy().align(shape).values) * 60,
+            decimal=7)
+
+        XYZ = multi_sds_to_XYZ_integration(
+            MSDS_ARRAY,
+            cmfs,
+            ILLUMINANTS_SDS['D65'],
+            shape=SpectralShape(400, 700, 60),
+            dtype=np.float32)
+        self.assertEqual(XYZ.dtype, np.float32)
+        np.testing.assert_almost_equal(
+            XYZ, XYZ_D65_ARRAY_INTEGRATION, decimal=4)
+
     def test_domain_range_scale_multi_sds_to_XYZ_integration(self):
         """
         Tests :func:`colour.colorimetry.tristimulus.\
@@ -1105,6 +1298,52 @@ class TestWavelength_to_XYZ(unittest.TestCase):
             np.array([0.44575583, 0.18184213, 0.00000000]),
             decimal=7)
 
+        cmfs = CMFS['CIE 1931 2 Degree Standard Observer'].copy()
+        wl = np.linspace(380, 780, 25)
+        for interpolator in (CubicSplineInterpolator, PchipInterpolator,
+                             LinearInterpolator):
+            cmfs.interpolator = interpolator
+            np.testing.assert_almost_equal(
+                wavelength_to_XYZ(wl, cmfs), cmfs[wl], decimal=7)
+
+            for wl_s in (555, [555], [[555]]):
+                self.assertEqual(
+                    wavelength_to_XYZ(wl_s, cmfs).shape,
+                    np.shape(wl_s) + (3, ))
+
+        XYZ = wavelength_to_XYZ(wl, cmfs)
+        cmfs.values = cmfs.values * 2
+        np.testing.assert_almost_equal(
+            wavelength_to_XYZ(wl, cmfs), XYZ * 2, decimal=7)
+
+    def test_cache_wavelength_to_XYZ(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.wavelength_to_XYZ`
+        definition interpolators cache.
+        """
+
+        cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+        wavelength_to_XYZ(480, cmfs)
+        gc.collect()
+        count = len(tristimulus._WAVELENGTH_TO_XYZ_INTERPOLATORS_CACHE)
+
+        for _ in range(10):
+            wavelength_to_XYZ(480, cmfs.copy())
+
+        gc.collect()
+        self.assertEqual(
+            len(tristimulus._WAVELENGTH_TO_XYZ_INTERPOLATORS_CACHE), count)
+
+        cmfs = cmfs.copy()
+        for interpolator in (CubicSplineInterpolator, PchipInterpolator):
+            cmfs.interpolator = interpolator
+            wavelength_to_XYZ(480, cmfs)
+
+        gc.collect()
+        self.assertEqual(
+            len(tristimulus._WAVELENGTH_TO_XYZ_INTERPOLATORS_CACHE),
+            count + 1)
+
     def test_raise_exception_wavelength_to_XYZ(self):
         """
         Tests :func:`colour.colorimetry.tristimulus.wavelength_to_XYZ`
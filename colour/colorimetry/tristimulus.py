@@ -35,16 +35,19 @@ References
 
 from __future__ import division, unicode_literals
 
+import hashlib
 import numpy as np
+import weakref
 
-from colour.algebra import lagrange_coefficients
+from colour.algebra import (CubicSplineInterpolator, PchipInterpolator,
+                            SpragueInterpolator)
 from colour.colorimetry import (DEFAULT_SPECTRAL_SHAPE,
                                 MultiSpectralDistributions, SpectralShape,
                                 STANDARD_OBSERVERS_CMFS, sd_ones)
-from colour.constants import DEFAULT_INT_DTYPE
-from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              filter_kwargs, from_range_100, runtime_warning,
-                              tsplit)
+from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
+from colour.utilities import (CaseInsensitiveMapping, as_array, as_float_array,
+                              filter_kwargs, from_range_100,
+                              is_numba_installed, runtime_warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2019 - Colour Developers'
@@ -78,6 +81,10 @@ _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE = None
 
 _TRISTIMULUS_WEIGHTING_FACTORS_CACHE = None
 
+_WAVELENGTH_TO_XYZ_INTERPOLATORS_CACHE = None
+
+_tristimulus_weighting_factors_kernel_ASTME2022 = None
+
 
 def lagrange_coefficients_ASTME2022(interval=10, interval_type='inner'):
     """
@@ -130,24 +137,132 @@ def lagrange_coefficients_ASTME2022(interval=10, interval_type='inner'):
 
     global _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE
     if _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE is None:
-        _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE = CaseInsensitiveMapping()
+        _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE = {}
+
+    interval_type = interval_type.lower()
 
-    name_lica = ', '.join((str(interval), interval_type))
-    if name_lica in _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE:
-        return _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE[name_lica]
+    key_lica = (interval, interval_type)
+    if key_lica in _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE:
+        return _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE[key_lica]
 
     r_n = np.linspace(1 / interval, 1 - (1 / interval), interval - 1)
     d = 3
-    if interval_type.lower() == 'inner':
+    if interval_type == 'inner':
         r_n += 1
         d = 4
 
-    lica = _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE[name_lica] = (
-        as_float_array([lagrange_coefficients(r, d) for r in r_n]))
+    # The denominators only depend on the nodes, and the numerators are
+    # computed by dividing out each node from the full product: the points
+    # :math:`r_n` never coincide with the nodes.
+    r_i = np.arange(d)
+    r_d = r_i[:, np.newaxis] - r_i[np.newaxis, :]
+    np.fill_diagonal(r_d, 1)
+    r_d = np.prod(r_d, axis=-1)
+
+    r_r = r_n[:, np.newaxis] - r_i[np.newaxis, :]
+    r_p = np.prod(r_r, axis=-1)[:, np.newaxis]
+
+    lica = _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE[key_lica] = (
+        as_float_array(r_p / (r_r * r_d)))
 
     return lica
 
 
+def _tristimulus_weighting_factors_kernel_ASTME2022_NumPy(
+        W, SY, c_c, c_b, r_c, i_c, i_cm, w_lif):
+    """
+    Accumulates in place the first, last and intermediate measurement
+    intervals contributions into given table of tristimulus weighting factors
+    using *NumPy* vectorised operations.
+    """
+
+    # First interval.
+    W[:3, :] += np.dot(np.transpose(c_c), SY[1:r_c + 1, :])
+
+    # Last interval.
+    W[i_cm - 2:i_cm + 1, :] += np.dot(
+        np.transpose(c_c[::-1]), SY[w_lif:w_lif + r_c, :])[::-1]
+
+    # Intermediate intervals, the interpolated values of the intervals are
+    # regularly strided and gathered with a reshaped view so that their
+    # contributions are computed with a single stacked matrix product.
+    SY_b = SY[r_c + 2:(r_c + 1) * (i_c - 2) + 1, :]
+    SY_b = SY_b.reshape([i_c - 3, r_c + 1, 3])[:, :r_c, :]
+    W_b = np.matmul(np.transpose(c_b), SY_b)
+    for i in range(4):
+        W[i:i + i_c - 3, :] += W_b[:, i, :]
+
+
+def _tristimulus_weighting_factors_kernel_ASTME2022_Numba(
+        W, SY, c_c, c_b, r_c, i_c, i_cm, w_lif):
+    """
+    Accumulates in place the first, last and intermediate measurement
+    intervals contributions into given table of tristimulus weighting factors
+    using explicit loops meant to be compiled with *Numba*.
+    """
+
+    # The last interval coefficients are reversed once so that they are
+    # traversed forward, with a contiguous layout, in the accumulation loop.
+    c_c_r = np.copy(c_c[::-1])
+    # The intermediate intervals coefficients are transposed once so that the
+    # four coefficients applied to a given wavelength are contiguous.
+    c_b_t = np.copy(c_b.T)
+
+    # The channels are iterated innermost: the interval indexes and
+    # coefficients are shared by the three channels of a given row.
+
+    # First interval.
+    for j in range(r_c):
+        for k in range(3):
+            c = c_c[j, k]
+            for i in range(3):
+                W[k, i] = W[k, i] + c * SY[j + 1, i]
+
+    # Last interval.
+    for j in range(r_c):
+        for k in range(3):
+            c = c_c_r[j, k]
+            for i in range(3):
+                W[i_cm - k, i] = W[i_cm - k, i] + c * SY[j + w_lif, i]
+
+    # Intermediate intervals.
+    for j in range(i_c - 3):
+        for k in range(r_c):
+            w_i = (r_c + 1) * (j + 1) + 1 + k
+            c_0, c_1 = c_b_t[0, k], c_b_t[1, k]
+            c_2, c_3 = c_b_t[2, k], c_b_t[3, k]
+            for i in range(3):
+                sy = SY[w_i, i]
+                W[j, i] = W[j, i] + c_0 * sy
+                W[j + 1, i] = W[j + 1, i] + c_1 * sy
+                W[j + 2, i] = W[j + 2, i] + c_2 * sy
+                W[j + 3, i] = W[j + 3, i] + c_3 * sy
+
+
+def _tristimulus_weighting_factors_kernel_ASTME2022_resolve():
+    """
+    Returns the kernel accumulating the tristimulus weighting factors, the
+    *Numba* kernel being compiled if *Numba* is installed.
+
+    *Numba* is only imported when the kernel is first resolved so that
+    importing the package does not incur its cost.
+    """
+
+    global _tristimulus_weighting_factors_kernel_ASTME2022
+    if _tristimulus_weighting_factors_kernel_ASTME2022 is None:
+        if is_numba_installed():  # pragma: no cover
+            from numba import njit
+
+            _tristimulus_weighting_factors_kernel_ASTME2022 = njit(
+                cache=True)(
+                    _tristimulus_weighting_factors_kernel_ASTME2022_Numba)
+        else:  # pragma: no cover
+            _tristimulus_weighting_factors_kernel_ASTME2022 = (
+                _tristimulus_weighting_factors_kernel_ASTME2022_NumPy)
+
+    return _tristimulus_weighting_factors_kernel_ASTME2022
+
+
 def tristimulus_weighting_factors_ASTME2022(cmfs, illuminant, shape, k=None):
     """
     Returns a table of tristimulus weighting factors for given colour matching
@@ -189,19 +304,8 @@ def tristimulus_weighting_factors_ASTME2022(cmfs, illuminant, shape, k=None):
     ------
     ValueError
         If the colour matching functions or illuminant intervals are not equal
-        to 1 nm.
-
-    Warning
-    -------
-    -   The tables of tristimulus weighting factors are cached in
-        :attr:`colour.colorimetry.tristimulus.\
-_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
-        defined by the colour matching functions and illuminant names along
-        with the current shape and normalisation constant :math:`k` such as:
-        `CIE 1964 10 Degree Standard Observer, A, (360.0, 830.0, 10.0), None`
-        Considering the above, one should be mindful that using similar colour
-        matching functions and illuminant names but with different spectral
-        data will lead to unexpected behaviour.
+        to 1 nm, or if the colour matching functions have fewer than 3
+        measurement wavelengths with given shape.
 
     Notes
     -----
@@ -212,6 +316,14 @@ _TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
         interpolating functions having a uniformly spaced independent variable
         and a *Cubic Spline* method for non-uniformly spaced independent
         variable.
+    -   The tables of tristimulus weighting factors are cached in
+        :attr:`colour.colorimetry.tristimulus.\
+_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
+        defined by the colour matching functions and illuminant names along
+        with the current shape, normalisation constant :math:`k` and a
+        *SHA-1* digest of the colour matching functions and illuminant
+        spectral data, thus similar names with different spectral data are
+        cached independently.
 
     References
     ----------
@@ -261,19 +373,26 @@ _TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
         raise ValueError(
             '"{0}" shape "interval" must be 1!'.format(illuminant))
 
+    Y = cmfs.values
+    S = illuminant.values
+
     global _TRISTIMULUS_WEIGHTING_FACTORS_CACHE
     if _TRISTIMULUS_WEIGHTING_FACTORS_CACHE is None:
-        _TRISTIMULUS_WEIGHTING_FACTORS_CACHE = CaseInsensitiveMapping()
+        _TRISTIMULUS_WEIGHTING_FACTORS_CACHE = {}
 
-    name_twf = ', '.join((cmfs.name, illuminant.name, str(shape), str(k)))
-    if name_twf in _TRISTIMULUS_WEIGHTING_FACTORS_CACHE:
-        return _TRISTIMULUS_WEIGHTING_FACTORS_CACHE[name_twf]
+    digest = hashlib.sha1(Y.tobytes())
+    digest.update(S.tobytes())
+    key_twf = (cmfs.name, illuminant.name, shape.start, shape.end,
+               shape.interval, k, digest.hexdigest())
+    if key_twf in _TRISTIMULUS_WEIGHTING_FACTORS_CACHE:
+        return _TRISTIMULUS_WEIGHTING_FACTORS_CACHE[key_twf]
 
-    Y = cmfs.values
-    S = illuminant.values
+    # Illuminant weighted colour matching functions, the products are shared
+    # by every accumulation below.
+    SY = S[:, np.newaxis] * Y
 
     interval_i = DEFAULT_INT_DTYPE(shape.interval)
-    W = S[::interval_i, np.newaxis] * Y[::interval_i, :]
+    W = SY[::interval_i, :].copy()
 
     # First and last measurement intervals *Lagrange Coefficients*.
     c_c = lagrange_coefficients_ASTME2022(interval_i, 'boundary')
@@ -291,38 +410,26 @@ _TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
     i_c = W.shape[0]
     i_cm = i_c - 1
 
-    # "k" is used as index in the nested loop.
-    k_n = k
-
-    for i in range(3):
-        # First interval.
-        for j in range(r_c):
-            for k in range(3):
-                W[k, i] = W[k, i] + c_c[j, k] * S[j + 1] * Y[j + 1, i]
-
-        # Last interval.
-        for j in range(r_c):
-            for k in range(i_cm, i_cm - 3, -1):
-                W[k, i] = (W[k, i] + c_c[r_c - j - 1, i_cm - k] * S[j + w_lif]
-                           * Y[j + w_lif, i])
+    # 1 nm measurement intervals do not have any interpolated values.
+    if r_c > 0:
+        # The first and last intervals each contribute to 3 measurement
+        # wavelengths, the kernels do not support fewer.
+        if i_c < 3:
+            raise ValueError(
+                '"{0}" colour matching functions have {1} measurement '
+                'wavelengths with "{2}" shape, at least 3 are '
+                'required!'.format(cmfs.name, i_c, shape))
 
-        # Intermediate intervals.
-        for j in range(i_c - 3):
-            for k in range(r_c):
-                w_i = (r_c + 1) * (j + 1) + 1 + k
-                W[j, i] = W[j, i] + c_b[k, 0] * S[w_i] * Y[w_i, i]
-                W[j + 1, i] = W[j + 1, i] + c_b[k, 1] * S[w_i] * Y[w_i, i]
-                W[j + 2, i] = W[j + 2, i] + c_b[k, 2] * S[w_i] * Y[w_i, i]
-                W[j + 3, i] = W[j + 3, i] + c_b[k, 3] * S[w_i] * Y[w_i, i]
+        _tristimulus_weighting_factors_kernel_ASTME2022_resolve()(
+            W, SY, c_c, c_b, r_c, i_c, i_cm, w_lif)
 
-        # Extrapolation of potential incomplete interval.
-        for j in range(
-                DEFAULT_INT_DTYPE(w_c - ((w_c - 1) % interval_i)), w_c, 1):
-            W[i_cm, i] = W[i_cm, i] + S[j] * Y[j, i]
+    # Extrapolation of potential incomplete interval.
+    w_e = DEFAULT_INT_DTYPE(w_c - ((w_c - 1) % interval_i))
+    W[i_cm, :] += np.sum(SY[w_e:, :], axis=0)
 
-    W *= 100 / np.sum(W, axis=0)[1] if k_n is None else k_n
+    W *= 100 / np.sum(W[:, 1]) if k is None else k
 
-    _TRISTIMULUS_WEIGHTING_FACTORS_CACHE[name_twf] = W
+    _TRISTIMULUS_WEIGHTING_FACTORS_CACHE[key_twf] = W
 
     return W
 
@@ -483,30 +590,34 @@ def sd_to_XYZ_integration(
     array([ 10.8401846...,   9.6837311...,   6.2120912...])
     """
 
-    if illuminant.shape != cmfs.shape:
+    shape = cmfs.shape
+    wavelengths = cmfs.wavelengths
+
+    # Computing the spectral shapes is expensive compared to the integration
+    # itself, they are only compared when the wavelengths are not already
+    # identical to those of the colour matching functions.
+    if (not np.array_equal(illuminant.wavelengths, wavelengths) and
+            illuminant.shape != shape):
         runtime_warning(
             'Aligning "{0}" illuminant shape to "{1}" colour matching '
             'functions shape.'.format(illuminant.name, cmfs.name))
-        illuminant = illuminant.copy().align(cmfs.shape)
+        illuminant = illuminant.copy().align(shape)
 
-    if sd.shape != cmfs.shape:
+    if (not np.array_equal(sd.wavelengths, wavelengths) and
+            sd.shape != shape):
         runtime_warning('Aligning "{0}" spectral distribution shape to "{1}" '
                         'colour matching functions shape.'.format(
                             sd.name, cmfs.name))
-        sd = sd.copy().align(cmfs.shape)
+        sd = sd.copy().align(shape)
 
     S = illuminant.values
-    x_bar, y_bar, z_bar = tsplit(cmfs.values)
+    xyz_bar = cmfs.values
     R = sd.values
-    dw = cmfs.shape.interval
+    dw = shape.interval
 
-    k = 100 / (np.sum(y_bar * S) * dw) if k is None else k
+    k = 100 / (np.dot(S, xyz_bar[..., 1]) * dw) if k is None else k
 
-    X_p = R * x_bar * S * dw
-    Y_p = R * y_bar * S * dw
-    Z_p = R * z_bar * S * dw
-
-    XYZ = k * np.sum(np.array([X_p, Y_p, Z_p]), axis=-1)
+    XYZ = k * np.dot(R * S, xyz_bar) * dw
 
     return from_range_100(XYZ)
 
@@ -675,18 +786,6 @@ def sd_to_XYZ_ASTME308(
     ndarray, (3,)
         *CIE XYZ* tristimulus values.
 
-    Warning
-    -------
-    -   The tables of tristimulus weighting factors are cached in
-        :attr:`colour.colorimetry.tristimulus.\
-_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
-        defined by the colour matching functions and illuminant names along
-        with the current shape and normalisation constant :math:`k` such as:
-        `CIE 1964 10 Degree Standard Observer, A, (360.0, 830.0, 10.0), None`
-        Considering the above, one should be mindful that using similar colour
-        matching functions and illuminant names but with different spectral
-        data will lead to unexpected behaviour.
-
     Notes
     -----
 
@@ -696,6 +795,15 @@ _TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
     | ``XYZ``   | [0, 100]              | [0, 1]        |
     +-----------+-----------------------+---------------+
 
+    -   The tables of tristimulus weighting factors are cached in
+        :attr:`colour.colorimetry.tristimulus.\
+_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
+        defined by the colour matching functions and illuminant names along
+        with the current shape, normalisation constant :math:`k` and a
+        *SHA-1* digest of the colour matching functions and illuminant
+        spectral data, thus similar names with different spectral data are
+        cached independently.
+
     References
     ----------
     :cite:`ASTMInternational2015b`
@@ -928,7 +1036,8 @@ def multi_sds_to_XYZ_integration(
         copy().trim(DEFAULT_SPECTRAL_SHAPE),
         illuminant=sd_ones(),
         k=None,
-        shape=DEFAULT_SPECTRAL_SHAPE):
+        shape=DEFAULT_SPECTRAL_SHAPE,
+        dtype=DEFAULT_FLOAT_DTYPE):
     """
     Converts given multi-spectral distributions to *CIE XYZ* tristimulus values
     using given colour matching functions and illuminant. The multi-spectral
@@ -964,6 +1073,9 @@ def multi_sds_to_XYZ_integration(
     shape : SpectralShape, optional
         Spectral shape of the multi-spectral distributions, ``cmfs`` and
         ``illuminant`` will be aligned to it.
+    dtype : type, optional
+        Data type used for the integration, e.g. :class:`np.float32` halves
+        the memory traffic of large multi-spectral images.
 
     Returns
     -------
@@ -987,6 +1099,10 @@ def multi_sds_to_XYZ_integration(
         illuminant to the given spectral shape while the latter favours
         precision by aligning the multi-spectral distributions to the colour
         matching functions.
+    -   The multi-spectral distributions and the illuminant weighted colour
+        matching functions are converted to the given ``dtype`` before the
+        integration, the *CIE XYZ* tristimulus values are returned with that
+        data type.
 
     References
     ----------
@@ -1062,14 +1178,24 @@ def multi_sds_to_XYZ_integration(
     """
 
     if isinstance(msds, MultiSpectralDistributions):
-        return as_float_array([
-            sd_to_XYZ_integration(sd, cmfs, illuminant, k)
-            for sd in msds.to_sds()
-        ])
+        if illuminant.shape != cmfs.shape:
+            runtime_warning(
+                'Aligning "{0}" illuminant shape to "{1}" colour matching '
+                'functions shape.'.format(illuminant.name, cmfs.name))
+            illuminant = illuminant.copy().align(cmfs.shape)
+
+        if msds.shape != cmfs.shape:
+            runtime_warning(
+                'Aligning "{0}" multi-spectral distributions shape to "{1}" '
+                'colour matching functions shape.'.format(
+                    msds.name, cmfs.name))
+            msds = msds.copy().align(cmfs.shape)
+
+        R = as_array(np.transpose(msds.values), dtype)
     else:
-        msds = as_float_array(msds)
+        R = as_array(msds, dtype)
 
-        msd_shape_m_1, shape_wl_count = msds.shape[-1], len(shape.range())
+        msd_shape_m_1, shape_wl_count = R.shape[-1], len(shape.range())
         assert msd_shape_m_1 == shape_wl_count, (
             'Multi-spectral distributions array with {0} wavelengths '
             'is not compatible with spectral shape with {1} wavelengths!'.
@@ -1085,19 +1211,30 @@ def multi_sds_to_XYZ_integration(
                 illuminant.name, shape))
             illuminant = illuminant.copy().align(shape)
 
-        S = illuminant.values
-        x_bar, y_bar, z_bar = tsplit(cmfs.values)
-        dw = cmfs.shape.interval
+    S = illuminant.values
+    xyz_bar = cmfs.values
+    dw = cmfs.shape.interval
 
-        k = 100 / (np.sum(y_bar * S) * dw) if k is None else k
+    k = 100 / (np.dot(S, xyz_bar[..., 1]) * dw) if k is None else k
 
-        X_p = msds * x_bar * S * dw
-        Y_p = msds * y_bar * S * dw
-        Z_p = msds * z_bar * S * dw
+    # The wavelengths axis of the multi-spectral distributions is contracted
+    # at once against the illuminant weighted colour matching functions, the
+    # boundary wavelengths at which the latter are null for the three
+    # channels do not contribute and are excluded from the contraction,
+    # unless the multi-spectral distributions are not finite there, in which
+    # case they must propagate as in the complete contraction.
+    S_xyz_bar = S[..., np.newaxis] * xyz_bar
+    i_n = np.flatnonzero(np.any(S_xyz_bar != 0, axis=-1))
+    s_n = slice(i_n[0], i_n[-1] + 1) if i_n.size else slice(0, 0)
+    if not (np.all(np.isfinite(R[..., :s_n.start])) and
+            np.all(np.isfinite(R[..., s_n.stop:]))):
+        s_n = slice(None)
 
-        XYZ = k * np.sum(np.array([X_p, Y_p, Z_p]), axis=-1)
+    W = as_array(k * S_xyz_bar[s_n] * dw, dtype)
 
-        return from_range_100(np.rollaxis(XYZ, 0, msds.ndim))
+    XYZ = np.dot(R[..., s_n], W)
+
+    return from_range_100(XYZ)
 
 
 def multi_sds_to_XYZ_ASTME308(
@@ -1316,6 +1453,9 @@ def multi_sds_to_XYZ(
         {:func:`colour.colorimetry.multi_sds_to_XYZ_integration`},
         Spectral shape of the multi-spectral distributions array :math:`msds`,
         ``cmfs`` and ``illuminant`` will be aligned to it.
+    dtype : type, optional
+        {:func:`colour.colorimetry.multi_sds_to_XYZ_integration`},
+        Data type used for the integration.
 
     Returns
     -------
@@ -1458,6 +1598,15 @@ def wavelength_to_XYZ(
     | ``XYZ``   | [0, 1]                | [0, 1]        |
     +-----------+-----------------------+---------------+
 
+    -   The colour matching functions interpolators are cached in
+        :attr:`colour.colorimetry.tristimulus.\
+_WAVELENGTH_TO_XYZ_INTERPOLATORS_CACHE` attribute. Their identifier key is
+        defined by the colour matching functions underlying signals functions
+        which are re-created whenever their data or interpolation settings
+        change. The cache only holds weak references to those functions and
+        a given entry is discarded as soon as one of them is garbage
+        collected.
+
     Examples
     --------
     >>> from colour import CMFS
@@ -1468,14 +1617,53 @@ def wavelength_to_XYZ(
     array([ 0.0914287...,  0.1418350...,  0.7915726...])
     """
 
-    cmfs_shape = cmfs.shape
-    if (np.min(wavelength) < cmfs_shape.start or
-            np.max(wavelength) > cmfs_shape.end):
+    wavelengths = cmfs.wavelengths
+    if (np.min(wavelength) < wavelengths[0] or
+            np.max(wavelength) > wavelengths[-1]):
         raise ValueError(
             '"{0}nm" wavelength is not in "[{1}, {2}]" domain!'.format(
-                wavelength, cmfs_shape.start, cmfs_shape.end))
-
-    XYZ = np.reshape(cmfs[np.ravel(wavelength)],
-                     as_float_array(wavelength).shape + (3, ))
+                wavelength, wavelengths[0], wavelengths[-1]))
+
+    global _WAVELENGTH_TO_XYZ_INTERPOLATORS_CACHE
+    if _WAVELENGTH_TO_XYZ_INTERPOLATORS_CACHE is None:
+        _WAVELENGTH_TO_XYZ_INTERPOLATORS_CACHE = {}
+
+    # The interpolators supporting a two-dimensional dependent variable are
+    # evaluated once for the three colour matching functions channels.
+    interpolator = cmfs.interpolator
+    if interpolator in (SpragueInterpolator, CubicSplineInterpolator,
+                        PchipInterpolator):
+        functions = [signal.function for signal in cmfs.signals.values()]
+        key = tuple(id(function) for function in functions)
+        if key in _WAVELENGTH_TO_XYZ_INTERPOLATORS_CACHE:
+            interpolator = _WAVELENGTH_TO_XYZ_INTERPOLATORS_CACHE[key][0]
+        else:
+            interpolator_args = dict(cmfs.interpolator_args)
+            if interpolator is not SpragueInterpolator:
+                interpolator_args['axis'] = 0
+
+            interpolator = interpolator(wavelengths, cmfs.values,
+                                        **interpolator_args)
+
+            def discard(reference):
+                """
+                Discards the cache entry when one of the signals functions it
+                is keyed on is garbage collected.
+                """
+
+                _WAVELENGTH_TO_XYZ_INTERPOLATORS_CACHE.pop(key, None)
+
+            _WAVELENGTH_TO_XYZ_INTERPOLATORS_CACHE[key] = (interpolator, [
+                weakref.ref(function, discard) for function in functions
+            ])
+
+        # The interpolators directly return an array with the wavelength
+        # shape extended by the colour matching functions channels.
+        XYZ = interpolator(wavelength)
+    else:
+        # The signals squeeze single element results, the wavelength shape
+        # is restored explicitly.
+        XYZ = np.reshape(cmfs[wavelength],
+                         as_float_array(wavelength).shape + (3, ))
 
     return XYZ
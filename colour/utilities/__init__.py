@@ -7,9 +7,9 @@ from .common import (
     handle_numpy_errors, ignore_numpy_errors, raise_numpy_errors,
     print_numpy_errors, warn_numpy_errors, ignore_python_warnings, batch,
     disable_multiprocessing, multiprocessing_pool, is_networkx_installed,
-    is_openimageio_installed, is_pandas_installed, is_iterable, is_string,
-    is_numeric, is_integer, is_sibling, filter_kwargs, filter_mapping,
-    first_item, get_domain_range_scale, set_domain_range_scale,
+    is_numba_installed, is_openimageio_installed, is_pandas_installed,
+    is_iterable, is_string, is_numeric, is_integer, is_sibling, filter_kwargs,
+    filter_mapping, first_item, get_domain_range_scale, set_domain_range_scale,
     domain_range_scale, to_domain_1, to_domain_10, to_domain_100,
     to_domain_degrees, to_domain_int, from_range_1, from_range_10,
     from_range_100, from_range_degrees, from_range_int)
@@ -31,13 +31,13 @@ __all__ += [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
     'batch', 'disable_multiprocessing', 'multiprocessing_pool',
-    'is_networkx_installed', 'is_openimageio_installed', 'is_pandas_installed',
-    'is_iterable', 'is_string', 'is_numeric', 'is_integer', 'is_sibling',
-    'filter_kwargs', 'filter_mapping', 'first_item', 'get_domain_range_scale',
-    'set_domain_range_scale', 'domain_range_scale', 'to_domain_1',
-    'to_domain_10', 'to_domain_100', 'to_domain_degrees', 'to_domain_int',
-    'from_range_1', 'from_range_10', 'from_range_100', 'from_range_degrees',
-    'from_range_int'
+    'is_networkx_installed', 'is_numba_installed', 'is_openimageio_installed',
+    'is_pandas_installed', 'is_iterable', 'is_string', 'is_numeric',
+    'is_integer', 'is_sibling', 'filter_kwargs', 'filter_mapping',
+    'first_item', 'get_domain_range_scale', 'set_domain_range_scale',
+    'domain_range_scale', 'to_domain_1', 'to_domain_10', 'to_domain_100',
+    'to_domain_degrees', 'to_domain_int', 'from_range_1', 'from_range_10',
+    'from_range_100', 'from_range_degrees', 'from_range_int'
 ]
 __all__ += [
     'as_array', 'as_int_array', 'as_float_array', 'as_numeric', 'as_int',
@@ -41,13 +41,13 @@ __all__ = [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
     'batch', 'disable_multiprocessing', 'multiprocessing_pool',
-    'is_networkx_installed', 'is_openimageio_installed', 'is_pandas_installed',
-    'is_iterable', 'is_string', 'is_numeric', 'is_integer', 'is_sibling',
-    'filter_kwargs', 'filter_mapping', 'first_item', 'get_domain_range_scale',
-    'set_domain_range_scale', 'domain_range_scale', 'to_domain_1',
-    'to_domain_10', 'to_domain_100', 'to_domain_degrees', 'to_domain_int',
-    'from_range_1', 'from_range_10', 'from_range_100', 'from_range_degrees',
-    'from_range_int'
+    'is_networkx_installed', 'is_numba_installed', 'is_openimageio_installed',
+    'is_pandas_installed', 'is_iterable', 'is_string', 'is_numeric',
+    'is_integer', 'is_sibling', 'filter_kwargs', 'filter_mapping',
+    'first_item', 'get_domain_range_scale', 'set_domain_range_scale',
+    'domain_range_scale', 'to_domain_1', 'to_domain_10', 'to_domain_100',
+    'to_domain_degrees', 'to_domain_int', 'from_range_1', 'from_range_10',
+    'from_range_100', 'from_range_degrees', 'from_range_int'
 ]
 
 
@@ -330,6 +330,38 @@ def is_networkx_installed(raise_exception=False):
         return False
 
 
+def is_numba_installed(raise_exception=False):
+    """
+    Returns if *Numba* is installed and available.
+
+    Parameters
+    ----------
+    raise_exception : bool
+        Raise exception if *Numba* is unavailable.
+
+    Returns
+    -------
+    bool
+        Is *Numba* installed.
+
+    Raises
+    ------
+    ImportError
+        If *Numba* is not installed.
+    """
+
+    try:  # pragma: no cover
+        import numba  # noqa
+
+        return True
+    except ImportError as error:  # pragma: no cover
+        if raise_exception:
+            raise ImportError(('"Numba" related API features, e.g. '
+                               'the compiled computational kernels, '
+                               'are not available: "{0}".').format(error))
+        return False
+
+
 def is_openimageio_installed(raise_exception=False):
     """
     Returns if *OpenImageIO* is installed and available.